@@ -1,45 +1,323 @@
+import bisect
+import functools
 import json
+import mmap
 import os
 import random
 import tkinter as tk
-from tkinter import ttk, messagebox
+from collections.abc import MutableMapping
+from tkinter import ttk, messagebox, font as tkfont
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON codec
+    orjson = None
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_FILE = os.path.join(BASE_DIR, "flashcard_data.json")
+DATA_FILE = os.path.join(BASE_DIR, "flashcard_data.jsonl")
+# Older single-object {name: [words]} file; read if DATA_FILE is missing, never written
+LEGACY_DATA_FILE = os.path.join(BASE_DIR, "flashcard_data.json")
+
+# Each line of DATA_FILE is {"name": <name>, "words": [<word>, ...]}
+_NAME_PREFIX = b'{"name": '
+_WORDS_SEP = b', "words": '
 
 
 # ----------------------------
 # Data persistence
 # ----------------------------
+def _dumps(obj):
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _clean_words(v):
+    """
+    Coerce a raw word array from disk into a list of stripped, non-empty strings.
+    """
+    return [s for s in (str(x).strip() for x in v) if s]
+
+
+@functools.lru_cache(maxsize=16)
+def _read_words(path, start, length):
+    """
+    Read and parse one set's word array from the data file.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            raw = f.read(length)
+        v = _loads(raw)
+    except (OSError, ValueError):
+        return []
+    return _clean_words(v) if isinstance(v, list) else []
+
+
+def _index_sets(mm):
+    """
+    Scan the lines of a memory-mapped data file and locate each set.
+
+    Only set names are decoded; word arrays stay on disk and are checked
+    when read (see _read_words). Lines that are not in the layout
+    save_data writes are parsed as a whole instead, and lines that cannot
+    be parsed at all are kept verbatim.
+
+    Returns:
+        tuple: ({group_name: (start, length) or [words]},
+                [(start, length), ...] of lines to keep verbatim)
+    """
+    sets = {}
+    unparsed = []
+    pos, size = 0, len(mm)
+    while pos < size:
+        nl = mm.find(b"\n", pos)
+        if nl == -1:
+            nl = size
+        end = nl
+        if end > pos and mm[end - 1:end] == b"\r":
+            end -= 1
+        if mm[pos:end].strip():
+            entry = _index_line(mm, pos, end)
+            if entry is None:
+                entry = _parse_line(mm[pos:end])
+            if entry is None:
+                unparsed.append((pos, end - pos))
+            else:
+                sets[entry[0]] = entry[1]
+        pos = nl + 1
+    return sets, unparsed
+
+
+def _index_line(mm, pos, end):
+    """
+    Locate the word array of a data line spanning mm[pos:end], if the line
+    is exactly in the layout save_data writes.
+
+    Returns:
+        tuple: (group_name, (start, length)) of its word array, or None
+    """
+    if mm[pos:pos + len(_NAME_PREFIX)] != _NAME_PREFIX or mm[end - 1:end] != b"}":
+        return None
+    # A '"' inside the encoded name is always escaped, so the first
+    # separator on the line is the one that ends the name.
+    sep = mm.find(_WORDS_SEP, pos, end)
+    if sep == -1:
+        return None
+    start = sep + len(_WORDS_SEP)
+    length = end - 1 - start  # drop the closing "}"
+    try:
+        name = _loads(mm[pos + len(_NAME_PREFIX):sep])
+    except ValueError:
+        return None
+    if not isinstance(name, str):
+        return None
+    return name, (start, length)
+
+
+def _parse_line(line):
+    """
+    Parse a data line written in any JSON formatting (e.g. by hand).
+
+    Returns:
+        tuple: (group_name, [words]), or None if the line is not a set
+    """
+    try:
+        obj = _loads(line)
+    except ValueError:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    name, words = obj.get("name"), obj.get("words")
+    if not isinstance(name, str) or not isinstance(words, list):
+        return None
+    return name, _clean_words(words)
+
+
+class WordSets(MutableMapping):
+    """
+    Mapping of {group_name: [words]} backed by the local data file.
+
+    Set names are known up front, but a set's words are only read from
+    disk the first time they are requested (a small LRU keeps recent ones).
+    Sets added or edited in memory are held as plain lists until saved;
+    `dirty` records whether anything changed since the last save. Lines
+    of the file that could not be parsed are carried along in `unparsed`
+    so a save never drops them.
+    """
+
+    def __init__(self, path=None, sets=None, unparsed=None):
+        self.path = path
+        self.dirty = False
+        self.unparsed = unparsed if unparsed is not None else []  # [(start, length)] in path
+        self._sets = sets if sets is not None else {}  # {name: [words] or (start, length)}
+
+    def __getitem__(self, name):
+        v = self._sets[name]
+        if isinstance(v, tuple):
+            return _read_words(self.path, *v)
+        return v
+
+    def __setitem__(self, name, words):
+        if name in self._sets and self[name] == words:
+            return
+        self._sets[name] = words
+        self.dirty = True
+
+    def __delitem__(self, name):
+        del self._sets[name]
+        self.dirty = True
+
+    def __contains__(self, name):
+        return name in self._sets
+
+    def __iter__(self):
+        return iter(self._sets)
+
+    def __len__(self):
+        return len(self._sets)
+
+    def entries(self):
+        """
+        Iterate (name, value) pairs without loading any words, where value
+        is either a list of words or the (start, length) of the set's word
+        array in self.path.
+        """
+        return self._sets.items()
+
+    def rebase(self, path, offsets, unparsed):
+        """
+        Point every set (and unparsed line) at its location in a freshly
+        written data file.
+        """
+        _read_words.cache_clear()
+        self.path = path
+        self.dirty = False
+        self.unparsed = list(unparsed)
+        self._sets = dict(offsets)
+
+
 def load_data():
     """
-    Load word set data from the local JSON file.
+    Load word set data from the local data file.
+
+    DATA_FILE holds one JSON object per line, {"name": ..., "words": [...]}.
+    Only names are read here; words are loaded lazily by WordSets. If it
+    does not exist yet, LEGACY_DATA_FILE (a single {name: [words]} object)
+    is loaded eagerly instead; it is left untouched, and the next save
+    writes DATA_FILE.
 
     Returns:
-        dict: {group_name: [word1, word2, ...]}
+        WordSets: {group_name: [word1, word2, ...]}
+    """
+    if os.path.exists(DATA_FILE):
+        return _load_sets_file()
+    if os.path.exists(LEGACY_DATA_FILE):
+        return _load_legacy_file()
+    return WordSets()
+
+
+def _load_sets_file():
+    """
+    Index DATA_FILE without reading any word lists into memory.
     """
-    if not os.path.exists(DATA_FILE):
-        return {}
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(DATA_FILE, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return WordSets()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sets, unparsed = _index_sets(mm)
+                return WordSets(DATA_FILE, sets, unparsed)
+    except Exception:
+        return WordSets()
+
+
+def _load_legacy_file():
+    """
+    Load every set from LEGACY_DATA_FILE.
+    """
+    try:
+        with open(LEGACY_DATA_FILE, "rb", buffering=64 * 1024) as f:
+            raw = f.read()
+        data = _loads(raw)
         if isinstance(data, dict):
             cleaned = {}
             for k, v in data.items():
                 if isinstance(k, str) and isinstance(v, list):
-                    cleaned[k] = [str(x) for x in v if str(x).strip()]
-            return cleaned
-        return {}
+                    cleaned[k] = _clean_words(v)
+            return WordSets(sets=cleaned)
+        return WordSets()
     except Exception:
-        return {}
+        return WordSets()
 
 
-def save_data(data: dict):
+def save_data(data):
     """
-    Save word set data to the local JSON file.
+    Save word set data to the local data file, one set per line.
+
+    Sets that were never loaded or edited, and lines that could not be
+    parsed, are copied byte-for-byte from the current file rather than
+    parsed and re-serialized. Lines are
+    written through a 64KB buffer to a temporary file, which is fsynced
+    and then atomically renamed over DATA_FILE, so a crash mid-save never
+    leaves a truncated file behind.
+
+    Returns:
+        tuple: ({group_name: (start, length)} of each set's word array,
+                [(start, length), ...] of the copied unparsed lines)
     """
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp = DATA_FILE + ".tmp"
+    offsets = {}
+    unparsed = []
+    pos = 0
+    src = None
+    try:
+        with open(tmp, "wb", buffering=64 * 1024) as f:
+            for start, length in data.unparsed:
+                if src is None:
+                    src = open(data.path, "rb")
+                src.seek(start)
+                line = src.read(length)
+                f.write(line)
+                f.write(b"\n")
+                unparsed.append((pos, len(line)))
+                pos += len(line) + 1
+            for name, v in data.entries():
+                head = _NAME_PREFIX + _dumps(name) + _WORDS_SEP
+                if isinstance(v, tuple):
+                    if src is None:
+                        src = open(data.path, "rb")
+                    src.seek(v[0])
+                    body = src.read(v[1])
+                else:
+                    body = _dumps(v)
+                f.write(head)
+                f.write(body)
+                f.write(b"}\n")
+                offsets[name] = (pos + len(head), len(body))
+                pos += len(head) + len(body) + 2
+            f.flush()
+            os.fsync(f.fileno())
+        if src is not None:
+            src.close()
+            src = None
+        os.replace(tmp, DATA_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    finally:
+        if src is not None:
+            src.close()
+    return offsets, unparsed
 
 
 def normalize_words(text: str):
@@ -50,16 +328,12 @@ def normalize_words(text: str):
     - Removes empty lines
     - De-duplicates words (case-insensitive) while preserving order
     """
-    lines = [ln.strip() for ln in text.splitlines()]
-    words = [w for w in lines if w]
-    seen = set()
-    uniq = []
-    for w in words:
-        key = w.lower()
-        if key not in seen:
-            uniq.append(w)
-            seen.add(key)
-    return uniq
+    uniq = {}
+    for ln in text.splitlines():
+        w = ln.strip()
+        if w:
+            uniq.setdefault(w.lower(), w)
+    return list(uniq.values())
 
 
 # ----------------------------
@@ -75,15 +349,21 @@ class FlashcardApp(tk.Tk):
         # Application state
         self.data = load_data()              # {group_name: [words]}
         self.current_group_name = None       # currently selected set
-        self.session_words = []              # shuffled words for review
+        self.session_words = []              # words of the set under review (not copied)
         self.index = 0                       # current card index
+        self._session_order = []             # indices into session_words, drawn so far
+        self._session_swaps = {}             # sparse Fisher-Yates swap table
         self.editing_group = None            # active edit target (None if not editing)
+        self._sorted_names = sorted((k.lower(), k) for k in self.data)  # [(lower, name)]
+        self._name_index = {k.lower(): k for k in self.data}            # {lower: name}
+        self._save_job = None                # pending after() id for a deferred save
 
         self._build_style()
         self._build_layout()
         self._refresh_group_list()
 
- 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
 
     # ---------- UI styling ----------
     def _build_style(self):
@@ -221,6 +501,7 @@ class FlashcardApp(tk.Tk):
         self.notebook.select(self.tab_create)
 
         # Reset Create tab when leaving edit mode
+        self._tab_create_id = str(self.tab_create)
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
 
@@ -305,8 +586,8 @@ class FlashcardApp(tk.Tk):
         """
         Save a new word set or update an existing one (edit mode).
         """
-        text = self.text_words.get("1.0", "end").strip()
-        words = normalize_words(text)
+        # normalize_words strips every line, so no whole-buffer strip is needed
+        words = normalize_words(self.text_words.get("1.0", "end-1c"))
 
         if self.editing_group:
             name = self.editing_group
@@ -321,8 +602,8 @@ class FlashcardApp(tk.Tk):
             return
 
         if self.editing_group:
-            self.data[name] = words
-            save_data(self.data)
+            self._set_group(name, words)
+            self._queue_save()
             self._refresh_group_list(select=name)
             messagebox.showinfo("Updated", f"Updated '{name}' with {len(words)} words.")
 
@@ -331,38 +612,127 @@ class FlashcardApp(tk.Tk):
             self.start_session(name)
             return
 
-        if name in self.data:
+        existing = self._name_index.get(name.lower())
+        if existing is not None:
             ok = messagebox.askyesno(
                 "Overwrite?",
-                f"A set named '{name}' already exists.\nDo you want to overwrite it?"
+                f"A set named '{existing}' already exists.\nDo you want to overwrite it?"
             )
             if not ok:
                 return
+            if existing != name:
+                self._remove_group(existing)
 
-        self.data[name] = words
-        save_data(self.data)
+        self._set_group(name, words)
+        self._queue_save()
         self._refresh_group_list(select=name)
         messagebox.showinfo("Saved", f"Saved '{name}' with {len(words)} words.")
 
 
+    def _set_group(self, name, words):
+        """
+        Add or replace a word set, keeping the name caches and the list
+        rows (which mirror self._sorted_names) in step.
+        """
+        if name not in self.data:
+            key = (name.lower(), name)
+            i = bisect.bisect_left(self._sorted_names, key)
+            self._sorted_names.insert(i, key)
+            self._name_index[name.lower()] = name
+            self.group_list.insert(i, name)
+        self.data[name] = words
+
+    def _remove_group(self, name):
+        """
+        Remove a word set, keeping the name caches and the list rows in step.
+        """
+        if name not in self.data:
+            return
+        del self.data[name]
+        i = bisect.bisect_left(self._sorted_names, (name.lower(), name))
+        del self._sorted_names[i]
+        self.group_list.delete(i)
+        # Names differing only in case sort next to each other, so any
+        # remaining variant is one of the neighbours of the removed row.
+        key = name.lower()
+        if self._name_index.get(key) == name:
+            for j in (i, i - 1):
+                if 0 <= j < len(self._sorted_names) and self._sorted_names[j][0] == key:
+                    self._name_index[key] = self._sorted_names[j][1]
+                    break
+            else:
+                del self._name_index[key]
+
+    def _save_data(self):
+        """
+        Persist self.data to DATA_FILE.
+        """
+        offsets, unparsed = save_data(self.data)
+        self.data.rebase(DATA_FILE, offsets, unparsed)
+
+    def _queue_save(self):
+        """
+        Schedule a single deferred save, so a burst of edits results in
+        one write.
+        """
+        if self._save_job is None:
+            self._save_job = self.after(500, self._flush_save)
+
+    def _flush_save(self):
+        """
+        Write pending changes to disk, if any set changed since the last
+        save, reporting any failure.
+
+        Returns:
+            bool: True if nothing is left unsaved
+        """
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+            self._save_job = None
+        if not self.data.dirty:
+            return True
+        try:
+            self._save_data()
+        except Exception as e:
+            messagebox.showerror("Save failed", f"Could not save your word sets:\n{e}")
+            return False
+        return True
+
+    def _on_close(self):
+        """
+        Flush pending changes before closing the window. If saving fails,
+        ask before quitting so unsaved edits are not silently lost.
+        """
+        if not self._flush_save():
+            ok = messagebox.askyesno(
+                "Quit without saving?",
+                "Your latest changes could not be saved.\nQuit anyway and lose them?"
+            )
+            if not ok:
+                return
+        self.destroy()
+
     # ---------- Group list ----------
     def _refresh_group_list(self, select=None):
         """
         Refresh the word set list in the left panel.
+
+        _set_group and _remove_group already insert or delete the single
+        changed row, so the list is only rebuilt here when it is out of
+        step with self._sorted_names (i.e. on the initial fill).
         """
-        self.group_list.delete(0, "end")
-        for group_name in sorted(self.data.keys(), key=lambda s: s.lower()):
-            self.group_list.insert("end", group_name)
+        names = self._sorted_names
+        if self.group_list.size() != len(names):
+            self.group_list.delete(0, "end")
+            self.group_list.insert("end", *(name for _, name in names))
 
         if select:
-            items = self.group_list.get(0, "end")
-            for i, g in enumerate(items):
-                if g == select:
-                    self.group_list.selection_clear(0, "end")
-                    self.group_list.selection_set(i)
-                    self.group_list.see(i)
-                    self.current_group_name = select
-                    break
+            i = bisect.bisect_left(names, (select.lower(), select))
+            if i < len(names) and names[i][1] == select:
+                self.group_list.selection_clear(0, "end")
+                self.group_list.selection_set(i)
+                self.group_list.see(i)
+                self.current_group_name = select
 
     def _selected_group_name(self):
         """
@@ -371,7 +741,7 @@ class FlashcardApp(tk.Tk):
         sel = self.group_list.curselection()
         if not sel:
             return None
-        return self.group_list.get(sel[0])
+        return self._sorted_names[sel[0]][1]
 
     def _on_group_select(self, event=None):
         """
@@ -391,17 +761,19 @@ class FlashcardApp(tk.Tk):
         ok = messagebox.askyesno("Delete?", f"Delete '{g}'? This cannot be undone.")
         if not ok:
             return
-        self.data.pop(g, None)
-        save_data(self.data)
+        was_current = g == self.current_group_name
+        self._remove_group(g)
+        self._queue_save()
         self.current_group_name = None
         self._refresh_group_list()
         messagebox.showinfo("Deleted", f"Deleted '{g}'.")
 
-        if g == self.current_group_name:
+        if was_current:
             self.session_words = []
             self.index = 0
-            self.lbl_group.configure(text="No set selected")
-            self.lbl_progress.configure(text="")
+            self._reset_order()
+            self.var_group.set("No set selected")
+            self.var_progress.set("")
             self._set_cards_enabled(False)
             self._render_card()
 
@@ -428,10 +800,13 @@ class FlashcardApp(tk.Tk):
         top.columnconfigure(0, weight=1)
         top.columnconfigure(1, weight=1)
 
-        self.lbl_group = ttk.Label(top, text="No set selected", font=("Helvetica", 13, "bold"))
+        self.var_group = tk.StringVar(self, value="No set selected")
+        self.var_progress = tk.StringVar(self, value="")
+
+        self.lbl_group = ttk.Label(top, textvariable=self.var_group, font=("Helvetica", 13, "bold"))
         self.lbl_group.grid(row=0, column=0, sticky="w")
 
-        self.lbl_progress = ttk.Label(top, text="", font=("Helvetica", 11), foreground="#b9c6ea")
+        self.lbl_progress = ttk.Label(top, textvariable=self.var_progress, font=("Helvetica", 11), foreground="#b9c6ea")
         self.lbl_progress.grid(row=0, column=1, sticky="e")
 
         # Card display area
@@ -447,8 +822,13 @@ class FlashcardApp(tk.Tk):
         )
         self.card_canvas.grid(row=0, column=0, sticky="nsew")
 
-        self.card_rect = None
+        # Canvas items are created on first render and reused afterwards
+        self.card_shadow_id = None
+        self.card_rect_id = None
         self.card_text_id = None
+        self.card_sub_id = None
+        self._font_cache = {}                # {size: tkfont.Font} for the card word
+        self._render_job = None
 
         # Navigation controls
         controls = ttk.Frame(self.tab_cards)
@@ -472,11 +852,11 @@ class FlashcardApp(tk.Tk):
         self.btn_edit.grid(row=0, column=3, sticky="ew", padx=(6, 0))
 
         # Keyboard shortcuts
-        self.bind("<Left>", lambda e: self.prev_card())
-        self.bind("<Right>", lambda e: self.next_card())
-        self.bind("<space>", lambda e: self.next_card())
+        self.bind("<Left>", self.prev_card)
+        self.bind("<Right>", self.next_card)
+        self.bind("<space>", self.next_card)
 
-        self.card_canvas.bind("<Configure>", lambda e: self._render_card())
+        self.card_canvas.bind("<Configure>", self._schedule_render)
 
         self._set_cards_enabled(False)
 
@@ -500,11 +880,11 @@ class FlashcardApp(tk.Tk):
             return
 
         self.current_group_name = group_name
-        self.session_words = list(self.data[group_name])
-        random.shuffle(self.session_words)
+        self.session_words = self.data[group_name]
         self.index = 0
+        self._reset_order()
 
-        self.lbl_group.configure(text=f"Set: {group_name}")
+        self.var_group.set(f"Set: {group_name}")
         self._update_progress()
         self._set_cards_enabled(True)
 
@@ -540,8 +920,7 @@ class FlashcardApp(tk.Tk):
         """
         Reset Create tab when leaving edit mode.
         """
-        tab = event.widget.nametowidget(event.widget.select())
-        if tab == self.tab_create and self.editing_group is None:
+        if str(event.widget.select()) == self._tab_create_id and self.editing_group is None:
             self.reset_create_form()
 
     def reshuffle(self):
@@ -550,12 +929,36 @@ class FlashcardApp(tk.Tk):
         """
         if not self.session_words:
             return
-        random.shuffle(self.session_words)
         self.index = 0
+        self._reset_order()
         self._update_progress()
         self._render_card()
 
-    def prev_card(self):
+    def _reset_order(self):
+        """
+        Start a new random order for the session, drawing only the first card.
+        """
+        self._session_order = []
+        self._session_swaps = {}
+        if self.session_words:
+            self._draw_card()
+
+    def _draw_card(self):
+        """
+        Draw the next index of the shuffled order.
+
+        This is one step of a Fisher-Yates shuffle over range(len(words)),
+        with swapped slots kept in a dict so unseen cards are never
+        materialized.
+        """
+        pos = len(self._session_order)
+        j = random.randrange(pos, len(self.session_words))
+        swaps = self._session_swaps
+        picked = swaps.get(j, j)
+        swaps[j] = swaps.pop(pos, pos)
+        self._session_order.append(picked)
+
+    def prev_card(self, event=None):
         """
         Move to the previous flashcard.
         """
@@ -566,7 +969,7 @@ class FlashcardApp(tk.Tk):
             self._update_progress()
             self._render_card()
 
-    def next_card(self):
+    def next_card(self, event=None):
         """
         Move to the next flashcard.
         """
@@ -574,26 +977,52 @@ class FlashcardApp(tk.Tk):
             return
         if self.index < len(self.session_words) - 1:
             self.index += 1
+            if self.index == len(self._session_order):
+                self._draw_card()
             self._update_progress()
             self._render_card()
         else:
-            messagebox.showinfo("Done!", "You reached the last card.\nYou can reshuffle to review again.")
+            total = len(self.session_words)
+            self.var_progress.set(f"{total} / {total}  — last card, press Reshuffle to review again")
 
     def _update_progress(self):
         """
         Update progress label (current / total).
         """
         if not self.session_words:
-            self.lbl_progress.configure(text="")
+            self.var_progress.set("")
             return
-        self.lbl_progress.configure(text=f"{self.index + 1} / {len(self.session_words)}")
+        self.var_progress.set(f"{self.index + 1} / {len(self.session_words)}")
+
+    def _schedule_render(self, event=None):
+        """
+        Coalesce bursts of resize events into a single card redraw.
+        """
+        if self._render_job:
+            self.after_cancel(self._render_job)
+        self._render_job = self.after(40, self._do_render)
+
+    def _do_render(self):
+        """
+        Run a redraw scheduled by _schedule_render.
+        """
+        self._render_job = None
+        self._render_card()
+
+    def _word_font(self, size):
+        """
+        Return a cached bold Helvetica font for the card word at this size.
+        """
+        f = self._font_cache.get(size)
+        if f is None:
+            f = tkfont.Font(self, family="Helvetica", size=size, weight="bold")
+            self._font_cache[size] = f
+        return f
 
     def _render_card(self):
         """
         Render the current flashcard on the canvas.
         """
-        self.card_canvas.delete("all")
-
         w = self.card_canvas.winfo_width()
         h = self.card_canvas.winfo_height()
         if w <= 10 or h <= 10:
@@ -606,45 +1035,53 @@ class FlashcardApp(tk.Tk):
         x1 = x0 + card_w
         y1 = y0 + card_h
 
-        self.card_canvas.create_rectangle(
-            x0 + 10, y0 + 10, x1 + 10, y1 + 10,
-            fill="#060a12", outline=""
-        )
-
-        self.card_canvas.create_rectangle(
-            x0, y0, x1, y1,
-            fill="#0f1a33",
-            outline="#20315c",
-            width=2
-        )
-
         if not self.session_words:
             word = "Select a set and start."
             sub = "Go to the left list → choose a set → Review."
         else:
-            word = self.session_words[self.index]
+            word = self.session_words[self._session_order[self.index]]
             sub = "Use buttons or ← / → / Space"
 
         base = max(26, min(52, card_w // 14))
         if len(word) > 12:
             base = max(22, base - (len(word) - 12) // 2)
 
-        self.card_canvas.create_text(
-            (w // 2), (h // 2) - 10,
-            text=word,
-            fill="#e8eefc",
-            font=("Helvetica", base, "bold"),
-            width=card_w - 90,
-            justify="center"
-        )
+        canvas = self.card_canvas
+        if self.card_rect_id is None:
+            self.card_shadow_id = canvas.create_rectangle(
+                x0 + 10, y0 + 10, x1 + 10, y1 + 10,
+                fill="#060a12", outline=""
+            )
+            self.card_rect_id = canvas.create_rectangle(
+                x0, y0, x1, y1,
+                fill="#0f1a33",
+                outline="#20315c",
+                width=2
+            )
+            self.card_text_id = canvas.create_text(
+                (w // 2), (h // 2) - 10,
+                fill="#e8eefc",
+                justify="center"
+            )
+            self.card_sub_id = canvas.create_text(
+                (w // 2), (y1 - 34),
+                fill="#b9c6ea",
+                font=("Helvetica", 11),
+                justify="center"
+            )
+        else:
+            canvas.coords(self.card_shadow_id, x0 + 10, y0 + 10, x1 + 10, y1 + 10)
+            canvas.coords(self.card_rect_id, x0, y0, x1, y1)
+            canvas.coords(self.card_text_id, (w // 2), (h // 2) - 10)
+            canvas.coords(self.card_sub_id, (w // 2), (y1 - 34))
 
-        self.card_canvas.create_text(
-            (w // 2), (y1 - 34),
-            text=sub,
-            fill="#b9c6ea",
-            font=("Helvetica", 11),
-            justify="center"
+        canvas.itemconfig(
+            self.card_text_id,
+            text=word,
+            font=self._word_font(base),
+            width=card_w - 90
         )
+        canvas.itemconfig(self.card_sub_id, text=sub)
 
 
 if __name__ == "__main__":